@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple, Iterable, Optional
+from typing import Dict, List, Set, Tuple, Iterable, Iterator, Optional, Sequence
 from collections import deque
+from itertools import accumulate, chain, compress
+from operator import and_
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import pickle
 import sys
 import os
 
@@ -16,15 +22,90 @@ class Graph:
     r: int
     s: str
     t: str
-    vertices: List[str]
-    red: Set[str]
-    adj: Dict[str, List[str]]      # adjacency: v -> neighbors (directed as given)
-    radj: Dict[str, List[str]]     # reverse adjacency for directed edges
+    vertices: List[str]            # id -> vertex name
+    red: Set[str]                  # red vertex names; solvers use red_mask
+    name_to_id: Dict[str, int]     # vertex name -> id
+    s_id: int
+    t_id: int
+    # Adjacency in CSR form over integer ids: the neighbors of v are
+    # indices[indptr[v]:indptr[v + 1]] (directed as given, both ways for "--").
+    indptr: array
+    indices: array
+    rindptr: array                 # reverse adjacency, same layout
+    rindices: array
+    red_mask: bytearray            # red_mask[v] == 1 iff vertex id v is red
+    red_ids: array                 # sorted ids of the red vertices
     has_undirected: bool           # True if any "--" edge appears
     has_directed: bool             # True if any "->" edge appears
 
 
-def parse_graph(path: str) -> Graph:
+# Bump whenever the Graph layout changes so stale parse caches are ignored.
+CACHE_VERSION = 2
+
+# solve_some gathers at the red ids below n/RATIO reds (100k-vertex masks: break-even ~n/56)
+RED_GATHER_RATIO = 64
+
+
+def _build_csr(n: int, src: Sequence[int], dst: Sequence[int]) -> Tuple[array, array]:
+    """Build CSR arrays (indptr, indices) for the arcs src[i] -> dst[i].
+       Neighbors keep the order in which their arcs appear.
+    """
+    # bucket the arcs per source with list.append driven by map(), so the
+    # per-arc work runs in C; exhausting the map via a zero-length deque
+    adj: List[List[int]] = [[] for _ in range(n)]
+    deque(map(list.append, map(adj.__getitem__, src), dst), maxlen=0)
+    indptr = array("i", [0])
+    indptr.extend(accumulate(map(len, adj)))
+    indices = array("i", chain.from_iterable(adj))
+    return indptr, indices
+
+
+def parse_graph(path: str, cache: bool = False) -> Graph:
+    """Parse a Red Scare instance file.
+       With cache=True the parsed graph is also pickled next to the input,
+       keyed by its mtime and size, and reused on later calls. Loading a
+       pickle can run arbitrary code, so only use caches from a trusted source.
+       An unreadable or foreign cache file is ignored and overwritten, and
+       caches left over from earlier versions of the input are removed.
+    """
+    if not cache:
+        return _parse_graph_file(path)
+
+    st = os.stat(path)
+    cache_path = f"{path}.{st.st_mtime_ns}.{st.st_size}.v{CACHE_VERSION}.cache"
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if isinstance(cached, Graph):
+            return cached
+    except Exception:
+        # missing, truncated or unpicklable (e.g. written by an older layout)
+        pass
+
+    G = _parse_graph_file(path)
+    # drop the caches of earlier mtimes/sizes/layouts before writing this one
+    pattern = glob.escape(path) + ".[0-9]*.[0-9]*.v[0-9]*.cache"
+    for stale in glob.glob(pattern):
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+    # write-then-rename so concurrent readers never see a partial file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # caching is best effort (e.g. read-only data directory)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return G
+
+
+def _parse_graph_file(path: str) -> Graph:
     with open(path, "r") as f:
         first = f.readline().split()
         if len(first) != 3:
@@ -53,41 +134,63 @@ def parse_graph(path: str) -> Graph:
             if len(parts) > 1 and parts[1] == "*":
                 red.add(v)
 
-        # init adjacency
-        adj: Dict[str, List[str]] = {v: [] for v in vertices}
-        radj: Dict[str, List[str]] = {v: [] for v in vertices}
-        name_set = set(vertices)
-
-        has_undirected = False
-        has_directed = False
-
-        # read <edges> block
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split()
-            if len(parts) != 3:
-                raise ValueError(f"Bad edge line in {path!r}: {line}")
-            u, arrow, v = parts
-            if u not in name_set or v not in name_set:
-                raise ValueError(f"Unknown vertex name in {path!r}: {u}, {v}")
-
-            if arrow == "--":
-                has_undirected = True
-                adj[u].append(v)
-                adj[v].append(u)
-                radj[u].append(v)
-                radj[v].append(u)
-            elif arrow == "->":
-                has_directed = True
-                adj[u].append(v)
-                radj[v].append(u)
-            else:
-                raise ValueError(f"Unknown edge type {arrow!r} in {path!r}")
-
-    if len(vertices) != n:
-        raise ValueError(f"{path!r}: expected {n} vertices, got {len(vertices)}")
+        if len(vertices) != n:
+            raise ValueError(f"{path!r}: expected {n} vertices, got {len(vertices)}")
+
+        name_to_id: Dict[str, int] = {v: i for i, v in enumerate(vertices)}
+        if s not in name_to_id or t not in name_to_id:
+            raise ValueError(f"Unknown s or t in {path!r}: {s}, {t}")
+
+        # read <edges> block in one go and split it into u, arrow, v columns
+        text = f.read()
+
+    tokens = text.split()
+    us, arrows, vs = tokens[0::3], tokens[1::3], tokens[2::3]
+    # Each non-blank line must be exactly "u arrow v". Files written as
+    # "u arrow v" with single spaces are recognized by rebuilding the lines
+    # from the tokens; anything else (extra blanks, odd spacing) is checked
+    # line by line.
+    lines = text.splitlines()
+    if lines != list(map(" ".join, zip(us, arrows, vs))):
+        for line in lines:
+            if len(line.split()) not in (0, 3):
+                raise ValueError(f"Bad edge line in {path!r}: {line.strip()}")
+
+    kinds = set(arrows)
+    bad_kinds = kinds - {"--", "->"}
+    if bad_kinds:
+        raise ValueError(f"Unknown edge type {min(bad_kinds)!r} in {path!r}")
+    has_undirected = "--" in kinds
+    has_directed = "->" in kinds
+
+    # the id lookup doubles as validation of the endpoint names
+    try:
+        uids = list(map(name_to_id.__getitem__, us))
+        vids = list(map(name_to_id.__getitem__, vs))
+    except KeyError as e:
+        raise ValueError(f"Unknown vertex name in {path!r}: {e.args[0]}") from None
+
+    # arcs as id pairs; an undirected edge contributes both directions.
+    if not has_undirected:
+        src, dst = uids, vids
+    elif not has_directed:
+        src, dst = uids + vids, vids + uids
+    else:
+        undirected = [arrow == "--" for arrow in arrows]
+        src = uids + list(compress(vids, undirected))
+        dst = vids + list(compress(uids, undirected))
+
+    indptr, indices = _build_csr(n, src, dst)
+    if has_directed:
+        rindptr, rindices = _build_csr(n, dst, src)
+    else:
+        # every arc has its reverse, so the reverse adjacency is the same graph
+        rindptr, rindices = indptr, indices
+
+    red_ids = array("i", sorted(name_to_id[v] for v in red))
+    red_mask = bytearray(n)
+    for v in red_ids:
+        red_mask[v] = 1
 
     return Graph(
         n=n,
@@ -97,105 +200,182 @@ def parse_graph(path: str) -> Graph:
         t=t,
         vertices=vertices,
         red=red,
-        adj=adj,
-        radj=radj,
+        name_to_id=name_to_id,
+        s_id=name_to_id[s],
+        t_id=name_to_id[t],
+        indptr=indptr,
+        indices=indices,
+        rindptr=rindptr,
+        rindices=rindices,
+        red_mask=red_mask,
+        red_ids=red_ids,
         has_undirected=has_undirected,
         has_directed=has_directed,
     )
 
 
-# ---------- Problem: None ----------
+# ---------- Problems: None and Few ----------
+
+def _zero_one_bfs(indptr: array, indices: array, cost: bytes, allowed: bytes,
+                  s: int, t: int) -> int:
+    """Cheapest s–t path where entering vertex u costs cost[u] (0 or 1) and
+       only vertices with allowed[u] are entered; s itself is free.
+       Return -1 if t cannot be reached.
+
+       Dial's bucket queue: with 0/1 costs only the buckets for distance d
+       and d + 1 are ever live, so two lists suffice. 0-cost moves stay in
+       the current bucket and 1-cost moves go to the next one; vertices in
+       a bucket share a distance, so each is a plain LIFO list.
+
+       A vertex is queued at most once per distance value, so the only
+       stale entry possible is one queued for d + 1 that was then reached at
+       d. No decrease-key heap is needed: dist[v] < d identifies it.
+    """
+    INF = 10**18
+    dist: List[int] = [INF] * len(cost)
+    dist[s] = 0
+    bucket: List[int] = [s]
+    next_bucket: List[int] = []
+    # bound methods hoisted out of the loop; rebound whenever the buckets swap
+    push, pop, push_next = bucket.append, bucket.pop, next_bucket.append
+    d = 0
+
+    while bucket:
+        v = pop()
+        if dist[v] == d:
+            if v == t:
+                return d
+            nd = d + 1
+            for u in indices[indptr[v]:indptr[v + 1]]:
+                if not allowed[u]:
+                    continue
+                if cost[u]:
+                    if nd < dist[u]:
+                        dist[u] = nd
+                        push_next(u)
+                elif d < dist[u]:
+                    dist[u] = d
+                    push(u)
+        if not bucket:
+            bucket, next_bucket = next_bucket, []
+            push, pop, push_next = bucket.append, bucket.pop, next_bucket.append
+            d += 1
+
+    return -1
+
 
-def solve_none(G: Graph) -> int:
+def solve_none(G: Graph, useful: Optional[bytes] = None) -> int:
     """Return length of shortest s–t path internally avoiding red vertices.
        Return -1 if no such path exists.
+       If given, the search is restricted to the vertices marked in useful
+       (see useful_mask); this never changes the answer.
     """
-    blocked: Set[str] = set(G.red)
+    allowed = bytearray(useful) if useful is not None else bytearray(b"\x01") * G.n
+    for v in G.red_ids:
+        allowed[v] = 0
     # s and t are allowed even if red (only internal vertices are forbidden)
-    blocked.discard(G.s)
-    blocked.discard(G.t)
-
-    if G.s not in G.adj or G.t not in G.adj:
-        return -1
-
-    dq = deque()
-    dq.append((G.s, 0))
-    visited: Set[str] = {G.s}
+    allowed[G.t_id] = 1
+    # every step costs one edge
+    cost = b"\x01" * G.n
+    return _zero_one_bfs(G.indptr, G.indices, cost, allowed, G.s_id, G.t_id)
 
-    while dq:
-        v, dist = dq.popleft()
-        if v == G.t:
-            return dist
-        for u in G.adj[v]:
-            if u in blocked:
-                continue
-            if u not in visited:
-                visited.add(u)
-                dq.append((u, dist + 1))
 
-    return -1
+def solve_few(G: Graph, useful: Optional[bytes] = None) -> int:
+    """Return minimum number of red vertices on any s–t path, or -1 if none.
+       Same 0-1 shortest-path kernel as solve_none, with entering a red vertex costing 1.
+       useful restricts the search as in solve_none.
+    """
+    allowed = useful if useful is not None else b"\x01" * G.n
+    few = _zero_one_bfs(G.indptr, G.indices, G.red_mask, allowed, G.s_id, G.t_id)
+    if few < 0:
+        return -1
+    # cost includes red(s) if s is red
+    return few + G.red_mask[G.s_id]
 
 
 # ---------- Problem: Some ----------
 
-def bfs_reachable(start: str, adj: Dict[str, List[str]]) -> Set[str]:
-    seen: Set[str] = set()
-    dq = deque([start])
-    seen.add(start)
-    while dq:
-        v = dq.popleft()
-        for u in adj[v]:
-            if u not in seen:
-                seen.add(u)
-                dq.append(u)
-    return seen
-
-
-def solve_some(G: Graph) -> bool:
-    """Return True if there is an s–t path that includes at least one red vertex."""
-    # Set of vertices reachable from s (forward)
-    reachable_from_s = bfs_reachable(G.s, G.adj)
-    # Set of vertices that can reach t (reverse graph)
-    can_reach_t = bfs_reachable(G.t, G.radj)
-
-    for v in G.red:
-        if v in reachable_from_s and v in can_reach_t:
-            return True
-    return False
-
+def bfs_reachable(start: int, indptr: array, indices: array) -> bytearray:
+    """Return a mask over vertex ids: 1 iff the vertex is reachable from start."""
+    n = len(indptr) - 1
+    visited = bytearray(n)
+    queue = array("i", [0]) * n
+    queue[0] = start
+    visited[start] = 1
+    head, tail = 0, 1
+    while head < tail:
+        v = queue[head]
+        head += 1
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            if visited[u]:
+                continue
+            visited[u] = 1
+            queue[tail] = u
+            tail += 1
+    return visited
 
-# ---------- Problem: Few ----------
 
-def solve_few(G: Graph) -> int:
-    """Return minimum number of red vertices on any s–t path, or -1 if none.
-       Uses Dijkstra-style shortest path with vertex costs (non-negative).
+def useful_mask(reachable_from_s: bytes, can_reach_t: bytes) -> bytes:
+    """Mask of the vertices that are both reachable from s and can reach t,
+       i.e. the only vertices any s–t path can visit.
     """
-    import heapq
+    n = len(reachable_from_s)
+    both = int.from_bytes(reachable_from_s, "little") & int.from_bytes(can_reach_t, "little")
+    return both.to_bytes(n, "little")
 
-    INF = 10**18
-    dist: Dict[str, int] = {v: INF for v in G.vertices}
-    # cost includes red(s) if s is red
-    dist[G.s] = 1 if G.s in G.red else 0
 
-    heap: List[Tuple[int, str]] = [(dist[G.s], G.s)]
+def solve_some(G: Graph, reachable_from_s: Optional[bytearray] = None,
+               can_reach_t: Optional[bytearray] = None) -> bool:
+    """Return True if there is an s–t path that includes at least one red vertex.
+       The two reachability masks are computed unless the caller passes them.
+    """
+    if reachable_from_s is None:
+        # Vertices reachable from s (forward)
+        reachable_from_s = bfs_reachable(G.s_id, G.indptr, G.indices)
+    if can_reach_t is None:
+        # Vertices that can reach t (reverse graph)
+        can_reach_t = bfs_reachable(G.t_id, G.rindptr, G.rindices)
+
+    # A red vertex lies on an s–t path iff it is in both masks.
+    red_ids = G.red_ids
+    if len(red_ids) * RED_GATHER_RATIO < G.n:
+        # few red vertices: gather both masks at the red ids only
+        return any(map(and_, map(reachable_from_s.__getitem__, red_ids),
+                       map(can_reach_t.__getitem__, red_ids)))
+    # otherwise read each 0/1 byte mask as one big integer and AND them word-wide
+    hit = (int.from_bytes(reachable_from_s, "little")
+           & int.from_bytes(can_reach_t, "little")
+           & int.from_bytes(G.red_mask, "little"))
+    return hit != 0
+
 
-    while heap:
-        d, v = heapq.heappop(heap)
-        if d != dist[v]:
-            continue
-        if v == G.t:
-            return d
-        for u in G.adj[v]:
-            add = 1 if u in G.red else 0
-            nd = d + add
-            if nd < dist[u]:
-                dist[u] = nd
-                heapq.heappush(heap, (nd, u))
+# ---------- Problem: Alternate ----------
 
-    return -1
+def _alternating_path_exists(indptr: array, indices: array, red_mask: bytearray,
+                             s: int, t: int) -> bool:
+    """BFS from s using only edges that connect a red and a non-red vertex."""
+    visited = bytearray(len(red_mask))
+    queue = array("i", [0]) * len(red_mask)
+    queue[0] = s
+    visited[s] = 1
+    head, tail = 0, 1
+
+    while head < tail:
+        v = queue[head]
+        head += 1
+        if v == t:
+            return True
+        v_red = red_mask[v]
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            # edge must connect red <-> non-red
+            if red_mask[u] == v_red or visited[u]:
+                continue
+            visited[u] = 1
+            queue[tail] = u
+            tail += 1
 
+    return False
 
-# ---------- Problem: Alternate ----------
 
 def solve_alternate(G: Graph) -> Optional[bool]:
     """Return True if there is a path from s to t that alternates red/non-red.
@@ -203,132 +383,157 @@ def solve_alternate(G: Graph) -> Optional[bool]:
     """
     if G.has_directed:
         return None
-    dq = deque([G.s])
-    seen: Set[str] = {G.s}
+    return _alternating_path_exists(G.indptr, G.indices, G.red_mask, G.s_id, G.t_id)
 
-    is_red = G.red.__contains__
 
-    while dq:
-        v = dq.popleft()
-        if v == G.t:
-            return True
-        for u in G.adj[v]:
-            # edge must connect red <-> non-red
-            if is_red(v) == is_red(u):
-                continue
-            if u not in seen:
-                seen.add(u)
-                dq.append(u)
+# ---------- Problem: Many (restricted class: directed acyclic graphs) ----------
 
+def _has_cycle(indptr: array, indices: array) -> bool:
+    """Iterative three-color DFS; stops at the first back edge."""
+    n = len(indptr) - 1
+    color = bytearray(n)  # 0=unseen,1=on stack,2=done
+    # explicit stack of (vertex, iterator over its remaining out-neighbors)
+    stack: List[Tuple[int, Iterator[int]]] = []
+    push, pop = stack.append, stack.pop
+    for start in range(n):
+        if color[start]:
+            continue
+        color[start] = 1
+        push((start, iter(indices[indptr[start]:indptr[start + 1]])))
+        while stack:
+            v, nbrs = stack[-1]
+            for u in nbrs:
+                c = color[u]
+                if c == 1:
+                    return True
+                if c == 0:
+                    color[u] = 1
+                    push((u, iter(indices[indptr[u]:indptr[u + 1]])))
+                    break
+            else:
+                color[v] = 2
+                pop()
     return False
 
 
-# ---------- Problem: Many (restricted class: directed acyclic graphs) ----------
-
 def has_directed_cycle(G: Graph) -> bool:
     """Detect if the directed version of G has a cycle."""
-    # we follow G.adj as given (directed edges + both directions for undirected)
-    # For Many we will only trust graphs with no undirected edges at all.
-    visited: Dict[str, int] = {v: 0 for v in G.vertices}  # 0=unseen,1=visiting,2=done
-
-    def dfs(v: str) -> bool:
-        visited[v] = 1
-        for u in G.adj[v]:
-            if visited[u] == 1:
-                return True
-            if visited[u] == 0 and dfs(u):
-                return True
-        visited[v] = 2
-        return False
-
-    for v in G.vertices:
-        if visited[v] == 0 and dfs(v):
-            return True
-    return False
+    # we follow the forward CSR as given (directed edges + both directions for undirected)
+    return _has_cycle(G.indptr, G.indices)
 
 
-def topo_order(G: Graph) -> List[str]:
-    """Topological order for directed acyclic graph (G.adj)."""
-    indeg = {v: 0 for v in G.vertices}
-    for v in G.vertices:
-        for u in G.adj[v]:
-            indeg[u] += 1
+def _max_red_path_kahn(indptr: array, indices: array, red_mask: bytearray,
+                       s: int, t: int, useful: Optional[bytes]) -> Optional[int]:
+    """Longest path DP (vertex weights red_mask[v]) fused into Kahn's algorithm:
+       each vertex relaxes its out-edges as it is emitted, so cycle detection,
+       topological order and DP share one pass over the edges.
+       Return None if the graph has a directed cycle, -1 if t is unreachable.
+    """
+    n = len(indptr) - 1
+    indeg = [0] * n
+    for u in indices:
+        indeg[u] += 1
 
-    dq = deque([v for v in G.vertices if indeg[v] == 0])
-    order: List[str] = []
-    while dq:
-        v = dq.popleft()
-        order.append(v)
-        for u in G.adj[v]:
+    NEG_INF = -10**18
+    dp: List[int] = [NEG_INF] * n
+    dp[s] = red_mask[s]
+
+    # the emitted order doubles as the FIFO queue: queue[head:] is still to be processed
+    queue = array("i", (v for v in range(n) if indeg[v] == 0))
+    emit = queue.append
+    head = 0
+    while head < len(queue):
+        v = queue[head]
+        head += 1
+        base = dp[v]
+        if base == NEG_INF or (useful is not None and not useful[v]):
+            # v is not on any s–t path: only release its successors
+            for u in indices[indptr[v]:indptr[v + 1]]:
+                indeg[u] -= 1
+                if indeg[u] == 0:
+                    emit(u)
+            continue
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            val = base + red_mask[u]
+            if val > dp[u]:
+                dp[u] = val
             indeg[u] -= 1
             if indeg[u] == 0:
-                dq.append(u)
-    if len(order) != len(G.vertices):
-        raise ValueError("Graph is not acyclic")
-    return order
+                emit(u)
 
+    if len(queue) < n:
+        return None
+    if dp[t] == NEG_INF:
+        return -1
+    return dp[t]
 
-def solve_many(G: Graph) -> Optional[int]:
+
+def solve_many(G: Graph, useful: Optional[bytes] = None) -> Optional[int]:
     """Return maximum number of red vertices on an s–t path.
        On general graphs this is NP-hard. We implement it only for
        a well-defined class: directed acyclic graphs with no '--' edges.
        If G is outside this class, return None.
+       useful restricts the DP as in solve_none; acyclicity is still
+       checked on the whole graph.
     """
     # Restrict to purely directed graphs (no "--")
     if G.has_undirected:
         return None
 
-    # Require acyclicity
-    if has_directed_cycle(G):
-        return None
-
-    # Now G is a DAG; we can do DP in topological order.
-    order = topo_order(G)
-    NEG_INF = -10**18
-    dp: Dict[str, int] = {v: NEG_INF for v in G.vertices}
-    dp[G.s] = 1 if G.s in G.red else 0
-
-    for v in order:
-        if dp[v] == NEG_INF:
-            continue
-        base = dp[v]
-        for u in G.adj[v]:
-            val = base + (1 if u in G.red else 0)
-            if val > dp[u]:
-                dp[u] = val
-
-    if dp[G.t] == NEG_INF:
-        return -1
-    return dp[G.t]
+    # One Kahn pass both checks acyclicity and runs the DP in topological order
+    return _max_red_path_kahn(G.indptr, G.indices, G.red_mask, G.s_id, G.t_id, useful)
 
 
 # ---------- CLI ----------
 
-def solve_all(G: Graph) -> Tuple[int, bool, Optional[int], int, Optional[bool]]:
+def solve_all(G: Graph, workers: int = 1) -> Tuple[int, bool, Optional[int], int, Optional[bool]]:
     """Run all five problems and return a tuple:
        (none, some, many, few, alternate)
+       The s/t reachability masks are computed once: they answer Some, settle
+       None/Few/Many when t is unreachable, and otherwise restrict the other
+       searches to the vertices that can lie on an s–t path.
+       With workers > 1 the remaining solvers run concurrently in a process
+       pool; they share no mutable state, so the results are identical.
     """
-    none_val = solve_none(G)
-    some_val = solve_some(G)
-    many_val = solve_many(G)
-    few_val = solve_few(G)
+    reachable_from_s = bfs_reachable(G.s_id, G.indptr, G.indices)
+    can_reach_t = bfs_reachable(G.t_id, G.rindptr, G.rindices)
+    some_val = solve_some(G, reachable_from_s, can_reach_t)
+
+    if not reachable_from_s[G.t_id]:
+        # no s–t path at all; Many still has to tell a DAG (-1) from "?!"
+        many_val = None if G.has_undirected or has_directed_cycle(G) else -1
+        alt_val = None if G.has_directed else False
+        return -1, some_val, many_val, -1, alt_val
+
+    useful = useful_mask(reachable_from_s, can_reach_t)
+    if workers > 1:
+        tasks = ((solve_none, useful), (solve_many, useful), (solve_few, useful), (solve_alternate,))
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+            futures = [ex.submit(solve, G, *args) for solve, *args in tasks]
+            none_val, many_val, few_val, alt_val = (f.result() for f in futures)
+        return none_val, some_val, many_val, few_val, alt_val
+
+    none_val = solve_none(G, useful)
+    many_val = solve_many(G, useful)
+    few_val = solve_few(G, useful)
     alt_val = solve_alternate(G)
     return none_val, some_val, many_val, few_val, alt_val
 
 
 def main(argv: List[str]) -> None:
-    if len(argv) != 2:
-        print(f"Usage: {argv[0]} <graph-file>", file=sys.stderr)
+    if len(argv) not in (2, 3) or (len(argv) == 3 and not argv[2].isdigit()):
+        print(f"Usage: {argv[0]} <graph-file> [workers]", file=sys.stderr)
         sys.exit(1)
 
     path = argv[1]
     if not os.path.exists(path):
         print(f"File not found: {path}", file=sys.stderr)
         sys.exit(1)
+    workers = int(argv[2]) if len(argv) == 3 else 1
 
     G = parse_graph(path)
 
-    none_val, some_val, many_val, few_val, alt_val = solve_all(G)
+    none_val, some_val, many_val, few_val, alt_val = solve_all(G, workers)
 
     print(f"File: {path}")
     print(f"n = {G.n}, m = {G.m}, r = {G.r}, s = {G.s}, t = {G.t}")
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 import os
 import sys
+import multiprocessing as mp
+from functools import partial
+from typing import List, Optional, Tuple
 
 # Make sure we can import red_scare when run from project root
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ""))
@@ -10,44 +13,63 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ""))
 import red_scare  # type: ignore
 
 
-def main() -> None:
+def format_row(path: str, cache: bool = True) -> Tuple[str, str, Optional[str]]:
+    """Parse and solve one instance; return its file name, its table row and
+       an error message (None on success). Runs in a worker process, so it
+       must not print. cache is passed on to parse_graph.
+    """
+    fname = os.path.basename(path)
+    try:
+        G = red_scare.parse_graph(path, cache=cache)
+        none_val, some_val, many_val, few_val, alt_val = red_scare.solve_all(G)
+
+        # Map results to the table format
+        # Alternate is only solved on supported graphs; otherwise None -> "?!"
+        if alt_val is None:
+            A = "?!"
+        else:
+            A = "true" if alt_val else "false"
+        F = str(few_val)
+        # Many: NP-hard in general; we only solve DAGs with no undirected edges.
+        # If our algorithm declines (returns None), mark as '?!' (hard).
+        if many_val is None:
+            M = "?!"
+        else:
+            M = str(many_val)
+        N = str(none_val)
+        S = "true" if some_val else "false"
+
+        return fname, f"{fname}\t{G.n}\t{A}\t{F}\t{M}\t{N}\t{S}", None
+    except Exception as e:
+        # If something completely breaks, mark whole row with '?'.
+        return fname, f"{fname}\t?\t?\t?\t?\t?\t?", f"# ERROR on {fname}: {e}"
+
+
+def main(argv: List[str]) -> None:
+    if argv[1:] not in ([], ["--no-cache"]):
+        print(f"Usage: {argv[0]} [--no-cache]", file=sys.stderr)
+        sys.exit(1)
+    cache = not argv[1:]
+
     data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
     files = sorted(
         f for f in os.listdir(data_dir)
         if f.endswith(".txt") and f != "README.md"
     )
+    paths = [os.path.join(data_dir, fname) for fname in files]
 
     # Header: instance name, n, A, F, M, N, S
     print("instance_name\tn\tA\tF\tM\tN\tS")
 
-    for fname in files:
-        path = os.path.join(data_dir, fname)
-        try:
-            G = red_scare.parse_graph(path)
-            none_val, some_val, many_val, few_val, alt_val = red_scare.solve_all(G)
-
-            # Map results to the table format
-            # Alternate is only solved on supported graphs; otherwise None -> "?!"
-            if alt_val is None:
-                A = "?!"
-            else:
-                A = "true" if alt_val else "false"
-            F = str(few_val)
-            # Many: NP-hard in general; we only solve DAGs with no undirected edges.
-            # If our algorithm declines (returns None), mark as '?!' (hard).
-            if many_val is None:
-                M = "?!"
-            else:
-                M = str(many_val)
-            N = str(none_val)
-            S = "true" if some_val else "false"
-
-            print(f"{fname}\t{G.n}\t{A}\t{F}\t{M}\t{N}\t{S}")
-        except Exception as e:
-            # If something completely breaks, mark whole row with '?'.
-            print(f"{fname}\t?\t?\t?\t?\t?\t?")
-            print(f"# ERROR on {fname}: {e}", file=sys.stderr)
+    # Instances are independent: solve them in parallel as workers free up,
+    # then print in file order
+    with mp.Pool() as pool:
+        results = sorted(pool.imap_unordered(partial(format_row, cache=cache), paths, chunksize=4))
+    for _, row, error in results:
+        print(row)
+        if error is not None:
+            print(error, file=sys.stderr)
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv)